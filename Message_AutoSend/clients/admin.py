@@ -1,9 +1,13 @@
 from django.contrib import admin
+from .forms import RecipientForm
 from .models import Recipient
 
 
 @admin.register(Recipient)
 class RecipientAdmin(admin.ModelAdmin):
+    # clean_email приводит адрес к нижнему регистру до проверки recipient_email_lowercase —
+    # без этой формы админка отклоняла бы email с заглавными буквами
+    form = RecipientForm
     list_display = ("email", "full_name", "created_at")
     search_fields = ("email", "full_name", "comment")
     list_filter = ("created_at",)
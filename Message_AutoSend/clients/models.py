@@ -1,5 +1,7 @@
+from functools import cached_property
+
 from django.db import models
-from django.core.validators import validate_email
+from django.db.models.functions import Lower
 
 
 class Recipient(models.Model):
@@ -24,6 +26,33 @@ class Recipient(models.Model):
         verbose_name = "Получатель рассылки"
         verbose_name_plural = "Получатели рассылки"
         ordering = ("-created_at",)
+        indexes = [
+            # постраничный список получателей по ordering без сортировки всей таблицы
+            models.Index(fields=["-created_at"], name="idx_recipient_created_desc"),
+        ]
+        constraints = [
+            # Ввод приводят к нижнему регистру save() и RecipientForm.clean_email;
+            # ограничение в БД ловит пути в обход них (update(), bulk_create, сырой SQL)
+            models.CheckConstraint(
+                condition=models.Q(email=Lower("email")),
+                name="recipient_email_lowercase",
+                violation_error_message="Email должен быть в нижнем регистре.",
+            ),
+        ]
 
     def __str__(self) -> str:
-        return f"{self.full_name} <{self.email}>"
\ No newline at end of file
+        return self.display
+
+    def save(self, *args, **kwargs):
+        # Дешёвая нормализация на любом пути сохранения, без full_clean() и валидаторов
+        if self.email:
+            self.email = self.email.strip().lower()
+        if self.full_name:
+            self.full_name = self.full_name.strip()
+        super().save(*args, **kwargs)
+
+    @cached_property
+    def display(self) -> str:
+        """Подпись получателя; считается один раз на экземпляр."""
+        name = (self.full_name or "").strip()
+        return f"{name} <{self.email}>" if name else self.email
\ No newline at end of file
@@ -0,0 +1,20 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+RECIPIENT_COUNT_CACHE_KEY = "recipient_count"
+RECIPIENT_COUNT_TIMEOUT = 60
+
+
+class CachedCountPaginator(Paginator):
+    """Пагинатор со счётчиком из кэша: COUNT(*) не выполняется на каждой странице.
+    Подходит только для нефильтрованного списка — ключ один на всю таблицу.
+    Сбрасывается сигналами при создании/удалении получателя (clients/signals.py)."""
+
+    @cached_property
+    def count(self) -> int:
+        return cache.get_or_set(
+            RECIPIENT_COUNT_CACHE_KEY,
+            lambda: Paginator.count.func(self),
+            timeout=RECIPIENT_COUNT_TIMEOUT,
+        )
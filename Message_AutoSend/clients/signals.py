@@ -0,0 +1,14 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Recipient
+from .paginators import RECIPIENT_COUNT_CACHE_KEY
+
+
+@receiver(post_save, sender=Recipient)
+@receiver(post_delete, sender=Recipient)
+def invalidate_recipient_count(sender, created: bool = True, **kwargs):
+    """Сбросить кэшированное число получателей (на update число не меняется)."""
+    if created:
+        cache.delete(RECIPIENT_COUNT_CACHE_KEY)
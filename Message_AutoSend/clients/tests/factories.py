@@ -0,0 +1,15 @@
+from clients.models import Recipient
+
+
+class RecipientFactory:
+    """Получатели для тестов.
+    Несколько строк создаём одним bulk_create (INSERT ... VALUES пачкой), а не create() на каждую."""
+
+    @staticmethod
+    def bulk(n: int, *, batch_size: int = 1000) -> list[Recipient]:
+        # emails сразу в нижнем регистре: bulk_create не вызывает save()/full_clean()
+        objs = [
+            Recipient(email=f"user{i}@example.com", full_name=f"Получатель {i}")
+            for i in range(n)
+        ]
+        return Recipient.objects.bulk_create(objs, batch_size=batch_size)
@@ -1,14 +1,18 @@
 from __future__ import annotations
+from django.contrib import messages
 from django.views.generic import (
     ListView,
     DetailView,
     CreateView,
     UpdateView,
     DeleteView,
-    TemplateView,
 )
+from django.db.models.functions import Substr
 from django.urls import reverse_lazy
+
+from .forms import RecipientForm
 from .models import Recipient
+from .paginators import CachedCountPaginator
 
 class RecipientListView(ListView):
     """Список всех получателей."""
@@ -16,6 +20,16 @@ class RecipientListView(ListView):
     template_name = "clients/recipient_list.html"
     context_object_name = "recipients"
     paginate_by = 20
+    paginator_class = CachedCountPaginator
+
+    def get_queryset(self):
+        # Комментарий (TEXT) в списке всё равно обрезается по ширине ячейки —
+        # берём из БД только начало, полный текст остаётся для DetailView
+        return (
+            super().get_queryset()
+            .only("id", "email", "full_name", "created_at")
+            .annotate(comment_preview=Substr("comment", 1, 120))
+        )
 
 
 class RecipientDetailView(DetailView):
@@ -28,21 +42,33 @@ class RecipientDetailView(DetailView):
 class RecipientCreateView(CreateView):
     """Создание нового получателя."""
     model = Recipient
+    form_class = RecipientForm
     template_name = "clients/recipient_form.html"
-    fields = ["name", "email", "phone"]  # укажи поля из твоей модели Recipient
     success_url = reverse_lazy("clients:recipient_list")
 
+    def form_valid(self, form):
+        messages.success(self.request, "Получатель успешно добавлен.")
+        return super().form_valid(form)
+
 
 class RecipientUpdateView(UpdateView):
     """Редактирование существующего получателя."""
     model = Recipient
+    form_class = RecipientForm
     template_name = "clients/recipient_form.html"
-    fields = ["name", "email", "phone"]
     success_url = reverse_lazy("clients:recipient_list")
 
+    def form_valid(self, form):
+        messages.success(self.request, "Данные получателя обновлены.")
+        return super().form_valid(form)
+
 
 class RecipientDeleteView(DeleteView):
     """Удаление получателя."""
     model = Recipient
     template_name = "clients/recipient_confirm_delete.html"
     success_url = reverse_lazy("clients:recipient_list")
+
+    def form_valid(self, form):
+        messages.success(self.request, "Получатель удалён.")
+        return super().form_valid(form)
@@ -0,0 +1,16 @@
+"""
+Celery application for config project.
+
+Worker for the mail queue:
+    celery -A config worker -Q email_queue --concurrency=2
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+app = Celery("config")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
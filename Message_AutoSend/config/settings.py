@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -58,8 +59,17 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Разобранные шаблоны держим в памяти процесса
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
@@ -79,10 +89,42 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Соединение живёт между запросами воркера; перед повторным использованием проверяется
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# Без REDIS_CACHE_URL — кэш в памяти процесса (локальная разработка).
+# В проде нужен общий Redis: кэш сбрасывается сигналами, и сброс должен
+# доходить до всех воркеров, а не только до того, где произошло сохранение.
+REDIS_CACHE_URL = os.getenv("REDIS_CACHE_URL", "")
+
+if REDIS_CACHE_URL:
+    CACHES = {
+        "default": {
+            # Разбор ответов — C-парсер hiredis (redis-py подхватывает его сам, если установлен)
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_CACHE_URL,
+            "OPTIONS": {
+                # общий пул соединений на процесс вместо нового сокета на запрос
+                "max_connections": int(os.getenv("REDIS_CACHE_MAX_CONNECTIONS", "50")),
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "message-autosend",
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -126,3 +168,15 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 DEFAULT_FROM_EMAIL = "no-reply@example.com"
+# Таймаут SMTP-сокета: зависший сервер не держит поток отправки (и воркер) бесконечно
+EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", "5"))
+# Сколько писем рассылки отправляется параллельно (потоков/SMTP-соединений)
+MAIL_CONCURRENCY = int(os.getenv("MAIL_CONCURRENCY", "8"))
+
+# Celery: отправка рассылок в фоне, отдельная очередь для почты
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
+CELERY_TASK_ROUTES = {
+    "mailings.tasks.send_mailing_task": {"queue": "email_queue"},
+}
+# Без брокера (локальная разработка) задачи выполняются сразу, в процессе запроса
+CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "1" if DEBUG else "0") == "1"
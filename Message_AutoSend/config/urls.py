@@ -14,7 +14,6 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import path, include
-from django.views.generic import TemplateView
 from mailings.views import HomeView
 
 
@@ -1,27 +1,85 @@
 from django.contrib import admin
+from django.core.cache import cache
+from django.db.models.functions import Substr
+from django.utils import timezone
+
+from clients.models import Recipient
+
 from .models import Mailing, MailingStatus, MailingLog, MailingAttempt
+from .paginators import EstimatedCountPaginator
+from .services import HOME_STATS_CACHE_KEY
 
 
 @admin.register(Mailing)
 class MailingAdmin(admin.ModelAdmin):
-    list_display = ("id", "status", "start_at", "end_at", "message", "created_at")
+    list_display = ("id", "status", "start_at", "end_at", "message_subject", "created_at")
     list_filter = ("status", "start_at", "end_at", "created_at")
-    search_fields = ("id", "message__title")  # подправь поле заголовка у Message
-    filter_horizontal = ("recipients",)
+    search_fields = ("id", "message__subject")
+    # поиск получателей на сервере вместо двух <select> со всей таблицей
+    autocomplete_fields = ("recipients",)
     readonly_fields = ("created_at", "updated_at", "last_sent_at")
+    show_full_result_count = False
 
     actions = ["recompute_status"]
 
+    def get_queryset(self, request):
+        # Для колонки нужна только тема: обрезаем в SQL, тело письма не джойним целиком.
+        # 81 символ — чтобы отличить тему ровно в 80 символов от более длинной.
+        return super().get_queryset(request).annotate(subj=Substr("message__subject", 1, 81))
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == "recipients":
+            # выбранные получатели рендерятся опциями — комментарии (TEXT) для подписи не нужны
+            kwargs["queryset"] = Recipient.objects.only("id", "email", "full_name")
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
+    @admin.display(description="Сообщение", ordering="message__subject")
+    def message_subject(self, obj):
+        txt = obj.subj or "(без темы)"
+        return txt if len(txt) <= 80 else txt[:77] + "..."
+
     @admin.action(description="Пересчитать статус у выбранных рассылок")
     def recompute_status(self, request, queryset):
-        for mailing in queryset:
-            mailing.refresh_status(save=True)
+        now = timezone.now()
+        status = Mailing.status_expression(now)
+        # Статус считает БД: один UPDATE только по строкам, где он поменялся.
+        # auto_now при update() сам не проставится — updated_at пишем явно.
+        updated = queryset.exclude(status=status).update(status=status, updated_at=now)
+        if updated:
+            # update() не шлёт post_save — кэш счётчиков главной сбрасываем сами
+            cache.delete(HOME_STATS_CACHE_KEY)
+        self.message_user(request, f"Статус обновлён у {updated} рассылок.")
+
+class LogStatusFilter(admin.SimpleListFilter):
+    """Фильтр по статусу лога. У поля нет choices, и стандартный фильтр
+    на каждой странице делает SELECT DISTINCT по всему журналу —
+    набор статусов почти не меняется, поэтому кэшируем его."""
+    title = "Статус"
+    parameter_name = "status"
+    cache_key = "mailing_log_statuses"
+    cache_timeout = 300
+
+    def lookups(self, request, model_admin):
+        statuses = cache.get_or_set(
+            self.cache_key,
+            lambda: list(MailingLog.objects.order_by("status").values_list("status", flat=True).distinct()),
+            self.cache_timeout,
+        )
+        return [(s, s) for s in statuses]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(status=self.value())
+        return queryset
 
 @admin.register(MailingLog)
 class MailingLogAdmin(admin.ModelAdmin):
     list_display = ("id", "mailing", "recipient", "status", "created_at", "triggered_by")
-    list_filter = ("status", "created_at")
+    list_filter = (LogStatusFilter, "created_at")
     search_fields = ("recipient", "detail", "triggered_by")
+    # журнал растёт без ограничений: без COUNT(*) по всей таблице на каждой странице
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 @admin.register(MailingAttempt)
 class MailingAttemptAdmin(admin.ModelAdmin):
@@ -29,8 +87,19 @@ class MailingAttemptAdmin(admin.ModelAdmin):
     list_filter = ("status", "attempted_at")
     search_fields = ("server_response",)
     autocomplete_fields = ("mailing",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # В списке нужен только префикс ответа: режем в БД, полный TEXT не тянем.
+        # 81 символ — чтобы отличить ответ ровно в 80 символов от более длинного.
+        return (
+            super().get_queryset(request)
+            .annotate(short_resp=Substr("server_response", 1, 81))
+            .defer("server_response")
+        )
 
     @admin.display(description="Ответ")
     def short_response(self, obj):
-        txt = obj.server_response or ""
+        txt = obj.short_resp or ""
         return txt if len(txt) <= 80 else txt[:77] + "..."
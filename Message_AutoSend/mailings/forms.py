@@ -21,7 +21,8 @@ class MailingForm(forms.ModelForm):
         end_at = cleaned.get("end_at")
         if start_at and end_at and end_at <= start_at:
             self.add_error("end_at", "Окончание должно быть позже начала.")
-        # (опционально) запрет на создание полностью прошедшей рассылки
-        if end_at and end_at <= timezone.now():
+        # (опционально) запрет на создание полностью прошедшей рассылки;
+        # elif — по уже отклонённому end_at вторую ошибку не добавляем
+        elif end_at and end_at <= timezone.now():
             self.add_error("end_at", "Окончание уже прошло.")
         return cleaned
\ No newline at end of file
@@ -21,7 +21,8 @@ class Command(BaseCommand):
         dry_run = options["dry_run"]
 
         try:
-            mailing = Mailing.objects.get(pk=pk)
+            # сообщение нужно сервису сразу; получателей он читает сам курсором
+            mailing = Mailing.objects.select_related("message").get(pk=pk)
         except Mailing.DoesNotExist as exc:
             raise CommandError(f"Рассылка с id={pk} не найдена") from exc
 
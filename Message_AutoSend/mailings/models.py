@@ -58,6 +58,11 @@ class Mailing(models.Model):
         verbose_name = "Рассылка"
         verbose_name_plural = "Рассылки"
         ordering = ("-created_at",)
+        indexes = [
+            # сортировка списка и фильтр по статусу + сортировка
+            models.Index(fields=["-created_at"], name="idx_mailing_created_desc"),
+            models.Index(fields=["status", "-created_at"], name="idx_mailing_status_created"),
+        ]
 
     def __str__(self) -> str:
         return f"Рассылка #{self.pk or '—'} — {self.status}"
@@ -83,6 +88,21 @@ class Mailing(models.Model):
             return MailingStatus.RUNNING
         return MailingStatus.CREATED
 
+    @staticmethod
+    def status_expression(now):
+        """compute_status в виде SQL-выражения — для пересчёта статусов одним UPDATE.
+        Условия должны совпадать с compute_status."""
+        return models.Case(
+            models.When(end_at__lte=now, then=models.Value(MailingStatus.FINISHED)),
+            # end_at > now уже гарантировано первой веткой
+            models.When(
+                models.Q(last_sent_at__isnull=False) | models.Q(start_at__lte=now),
+                then=models.Value(MailingStatus.RUNNING),
+            ),
+            default=models.Value(MailingStatus.CREATED),
+            output_field=models.CharField(),
+        )
+
     def refresh_status(self, save: bool = True) -> None:
         """Пересчитать и (опционально) сохранить статус."""
         new_status = self.compute_status()
@@ -93,12 +113,9 @@ class Mailing(models.Model):
 
     def save(self, *args, **kwargs):
         self.full_clean()
-        # При первом сохранении по умолчанию "Создана"
-        if not self.pk and not self.status:
-            self.status = MailingStatus.CREATED
+        # Статус по времени/флагам считаем до записи — он уходит тем же INSERT/UPDATE
+        self.status = self.compute_status()
         super().save(*args, **kwargs)
-        # После сохранения подправим статус согласно времени/флагам
-        self.refresh_status(save=True)
 
 class MailingLog(models.Model):
     mailing = models.ForeignKey(
@@ -0,0 +1,33 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+# ниже этого порога оценка неточна, а честный COUNT(*) и так дешёвый
+ESTIMATE_THRESHOLD = 10_000
+
+
+class EstimatedCountPaginator(Paginator):
+    """Пагинатор для больших журналов (логи/попытки) в админке.
+    Без фильтров и поиска на PostgreSQL число строк берётся из статистики
+    планировщика (pg_class.reltuples) вместо COUNT(*) по всей таблице.
+    С фильтром, на других СУБД или на маленькой таблице — обычный COUNT(*)."""
+
+    @cached_property
+    def count(self) -> int:
+        query = getattr(self.object_list, "query", None)
+        if query is not None and not query.where:
+            estimate = self._estimate(self.object_list.db, query.model._meta.db_table)
+            if estimate >= ESTIMATE_THRESHOLD:
+                return estimate
+        return Paginator.count.func(self)
+
+    @staticmethod
+    def _estimate(using: str, table: str) -> int:
+        connection = connections[using]
+        if connection.vendor != "postgresql":
+            return -1
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [table])
+            row = cursor.fetchone()
+        # -1: таблица ещё ни разу не анализировалась
+        return int(row[0]) if row else -1
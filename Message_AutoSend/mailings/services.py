@@ -1,12 +1,24 @@
 from __future__ import annotations
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from itertools import islice
+from typing import Iterable, Iterator
 
-from django.core.mail import send_mail
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
 from django.utils import timezone
 from django.conf import settings
+from django.db.models import Count, Exists, OuterRef, Q
 
-from .models import Mailing, MailingLog, MailingAttempt, AttemptStatus
+from clients.models import Recipient
+
+from .models import Mailing, MailingLog, MailingAttempt, AttemptStatus, MailingStatus
+
+HOME_STATS_CACHE_KEY = "home_stats"
+HOME_STATS_TIMEOUT = 60
+# сколько получателей читаем/отправляем/пишем в БД за одну пачку
+MAIL_CHUNK_SIZE = 2000
 
 
 @dataclass
@@ -17,21 +29,70 @@ class SendResult:
 
 
 def _iter_emails(mailing: Mailing) -> Iterable[tuple[str, str]]:
-    """Возвращает пары (email, recipient_name) для всех получателей рассылки.
-    Правь под свои поля модели Recipient."""
-    for r in mailing.recipients.all():
-        email: Optional[str] = getattr(r, "email", None)
-        name: str = getattr(r, "name", "") or ""
-        if email:
-            yield (email, name)
+    """Возвращает пары (email, full_name) для всех получателей рассылки.
+    Берём только две колонки кортежами, пустые email отсекаются в SQL.
+    Строки читаются курсором пачками, без загрузки всего списка в память."""
+    yield from (
+        mailing.recipients.exclude(email="")
+        .values_list("email", "full_name")
+        .iterator(chunk_size=MAIL_CHUNK_SIZE)
+    )
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _deliver_all(emails: Iterable[str], subject: str, body: str, from_email: str) -> Iterator[tuple[str, str]]:
+    """Отправить письма пулом потоков (SMTP — чистое I/O).
+    Отдаёт (статус, ответ сервера) в порядке emails. В БД не пишет.
+    В пул уходит не больше MAIL_CHUNK_SIZE писем за раз — память не растёт с размером рассылки.
+    У каждого потока своё соединение: SMTP-backend Django не потокобезопасен."""
+    local = threading.local()
+    connections = []
+
+    def _open_connection() -> None:
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception:  # noqa: BLE001
+            # не открылось заранее — send_messages попробует сам и ошибка попадёт в попытку
+            pass
+        local.connection = connection
+        connections.append(connection)
+
+    def _deliver(email: str) -> tuple[str, str]:
+        try:
+            sent_count = EmailMessage(
+                subject=subject,
+                body=body,
+                from_email=from_email,
+                to=[email],
+                connection=local.connection,
+            ).send(fail_silently=False)
+        except Exception as exc:  # noqa: BLE001
+            return AttemptStatus.FAIL, str(exc)
+        if sent_count > 0:
+            return AttemptStatus.SUCCESS, f"send_mail returned {sent_count}"
+        return AttemptStatus.FAIL, "send_mail returned 0"
+
+    max_workers = max(1, getattr(settings, "MAIL_CONCURRENCY", 8))
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, initializer=_open_connection) as executor:
+            for chunk in _chunked(emails, MAIL_CHUNK_SIZE):
+                yield from executor.map(_deliver, chunk)
+    finally:
+        for connection in connections:
+            connection.close()
 
 
 def send_mailing(mailing: Mailing, *, user=None, dry_run: bool = False) -> SendResult:
     """Ручная отправка рассылки по email. Можно расширить для SMS/мессенджеров.
     - Если dry_run=True, ничего не отправляет, только считает.
     - При успехе проставляет last_sent_at и обновляет статус."""
-    recipient_emails = list(_iter_emails(mailing))
-    total = len(recipient_emails)
+    total = mailing.recipients.exclude(email="").count()
     sent = 0
     skipped = 0
 
@@ -42,50 +103,59 @@ def send_mailing(mailing: Mailing, *, user=None, dry_run: bool = False) -> SendR
     # если не настроен EMAIL_BACKEND — в dev-режиме можно указать 'django.core.mail.backends.console.EmailBackend'
     from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@example.com")
 
-    for email, name in recipient_emails:
-        if dry_run:
-            MailingAttempt.objects.create(
-                mailing=mailing,
-                status=AttemptStatus.SUCCESS,  # симулируем успешную попытку
-                server_response="DRY-RUN: письмо не отправлялось",
-            )
-            skipped += 1
-            continue
+    if dry_run:
+        # одна сводная попытка вместо строки на каждого получателя
+        MailingAttempt.objects.create(
+            mailing=mailing,
+            status=AttemptStatus.SUCCESS,  # симулируем успешную попытку
+            server_response=f"DRY-RUN: письма не отправлялись, получателей: {total}",
+        )
+        return SendResult(total=total, sent=0, skipped=total)
 
-        try:
-            sent_count = send_mail(
-                subject=subject,
-                message=body,
-                from_email=from_email,
-                recipient_list=[email],
-                fail_silently=False,
-            )
-            if sent_count > 0:
+    emails = (email for email, name in _iter_emails(mailing))
+    results = _deliver_all(emails, subject, body, from_email)
+
+    # попытки пишем пачками, а не INSERT на каждого получателя
+    for chunk in _chunked(results, MAIL_CHUNK_SIZE):
+        attempts: list[MailingAttempt] = []
+        for status, response in chunk:
+            if status == AttemptStatus.SUCCESS:
                 sent += 1
-                MailingAttempt.objects.create(
-                    mailing=mailing,
-                    status=AttemptStatus.SUCCESS,
-                    server_response=f"send_mail returned {sent_count}",
-                )
             else:
                 skipped += 1
-                MailingAttempt.objects.create(
-                    mailing=mailing,
-                    status=AttemptStatus.FAIL,
-                    server_response="send_mail returned 0",
-                )
-        except Exception as exc:  # noqa: BLE001
-            skipped += 1
-            MailingAttempt.objects.create(
-                mailing=mailing,
-                status=AttemptStatus.FAIL,
-                server_response=str(exc),
-            )
+            attempts.append(MailingAttempt(mailing=mailing, status=status, server_response=response))
+        MailingAttempt.objects.bulk_create(attempts, batch_size=500)
 
     # отметим факт отправки хотя бы раз
-    if not dry_run and sent > 0:
+    if sent > 0:
         mailing.last_sent_at = timezone.now()
         mailing.refresh_status(save=True)
 
     return SendResult(total=total, sent=sent, skipped=skipped)
 
+
+def _compute_home_stats() -> dict[str, int]:
+    # Оба счётчика рассылок — одним запросом
+    stats = Mailing.objects.aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(status=MailingStatus.RUNNING)),
+    )
+
+    # Уникальные получатели, участвующие хотя бы в одной рассылке:
+    # EXISTS (semi-join) вместо JOIN + DISTINCT
+    through = Mailing.recipients.through
+    unique_recipients = Recipient.objects.filter(
+        Exists(through.objects.filter(recipient_id=OuterRef("pk")))
+    ).count()
+
+    return {
+        "total_mailings": stats["total"],
+        "active_mailings": stats["active"],
+        "unique_recipients": unique_recipients,
+    }
+
+
+def get_home_stats() -> dict[str, int]:
+    """Счётчики для главной страницы. Кэшируются на HOME_STATS_TIMEOUT секунд,
+    сбрасываются сигналами при изменении рассылок/получателей (mailings/signals.py)."""
+    return cache.get_or_set(HOME_STATS_CACHE_KEY, _compute_home_stats, timeout=HOME_STATS_TIMEOUT)
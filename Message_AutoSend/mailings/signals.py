@@ -0,0 +1,17 @@
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from clients.models import Recipient
+
+from .models import Mailing
+from .services import HOME_STATS_CACHE_KEY
+
+
+@receiver(post_save, sender=Mailing)
+@receiver(post_delete, sender=Mailing)
+@receiver(m2m_changed, sender=Mailing.recipients.through)
+@receiver(post_delete, sender=Recipient)
+def invalidate_home_stats(sender, **kwargs):
+    """Сбросить кэш счётчиков главной страницы."""
+    cache.delete(HOME_STATS_CACHE_KEY)
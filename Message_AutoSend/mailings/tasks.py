@@ -0,0 +1,21 @@
+from __future__ import annotations
+from dataclasses import asdict
+from typing import Optional
+
+from celery import shared_task
+from django.contrib.auth import get_user_model
+
+from .models import Mailing
+from .services import send_mailing
+
+
+@shared_task
+def send_mailing_task(mailing_id: int, user_id: Optional[int] = None, dry_run: bool = False) -> Optional[dict]:
+    """Фоновая отправка рассылки (очередь email_queue).
+    Рассылку перечитываем из БД: между постановкой в очередь и запуском её могли изменить или удалить."""
+    mailing = Mailing.objects.select_related("message").filter(pk=mailing_id).first()
+    if mailing is None:
+        return None
+    user = get_user_model().objects.filter(pk=user_id).first() if user_id else None
+    result = send_mailing(mailing, user=user, dry_run=dry_run)
+    return asdict(result)
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from mailings.models import Mailing, MailingStatus
+from messages_app.models import Message
+
+
+class StatusExpressionTests(TestCase):
+    def test_sql_status_matches_compute_status(self):
+        now = timezone.now()
+        message = Message.objects.create(subject="Тема", body="Текст")
+        cases = [
+            (now + timedelta(hours=1), now + timedelta(days=1), None),  # ещё не началась
+            (now + timedelta(hours=1), now + timedelta(days=1), now),  # не началась, но уже отправляли
+            (now - timedelta(hours=1), now + timedelta(days=1), None),  # идёт
+            (now - timedelta(days=2), now - timedelta(days=1), now),  # закончилась
+        ]
+        for start_at, end_at, last_sent_at in cases:
+            Mailing.objects.create(start_at=start_at, end_at=end_at, last_sent_at=last_sent_at, message=message)
+        # статусы «портим», чтобы сравнивать именно пересчёт
+        Mailing.objects.update(status=MailingStatus.CREATED)
+
+        now = timezone.now()
+        rows = Mailing.objects.annotate(sql_status=Mailing.status_expression(now))
+        self.assertEqual(
+            [m.sql_status for m in rows.order_by("pk")],
+            [m.compute_status() for m in rows.order_by("pk")],
+        )
+        self.assertEqual(
+            sorted(m.sql_status for m in rows),
+            sorted([MailingStatus.CREATED, MailingStatus.RUNNING, MailingStatus.RUNNING, MailingStatus.FINISHED]),
+        )
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.core import mail
+from django.test import TestCase
+from django.utils import timezone
+
+from clients.tests.factories import RecipientFactory
+from mailings.models import Mailing, MailingAttempt, AttemptStatus
+from mailings.services import send_mailing
+from messages_app.models import Message
+
+
+class SendMailingTests(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        message = Message.objects.create(subject="Привет", body="Текст")
+        self.mailing = Mailing.objects.create(
+            start_at=now - timedelta(hours=1), end_at=now + timedelta(days=1), message=message
+        )
+        self.mailing.recipients.set(RecipientFactory.bulk(2))
+
+    def test_send_creates_attempt_per_recipient(self):
+        result = send_mailing(self.mailing)
+        self.assertEqual((result.total, result.sent, result.skipped), (2, 2, 0))
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(
+            MailingAttempt.objects.filter(mailing=self.mailing, status=AttemptStatus.SUCCESS).count(), 2
+        )
+
+    def test_dry_run_writes_single_summary_attempt(self):
+        result = send_mailing(self.mailing, dry_run=True)
+        self.assertEqual((result.total, result.sent, result.skipped), (2, 0, 2))
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(MailingAttempt.objects.filter(mailing=self.mailing).count(), 1)
@@ -5,12 +5,12 @@ from django.views.generic import ListView, DetailView, CreateView, UpdateView, D
 from django.contrib import messages
 from django.shortcuts import redirect, get_object_or_404
 from django.views import View
-from django.db.models import Count
+from django.db.models import BooleanField, Case, Count, Value, When
 
 from .forms import MailingForm
 from .models import Mailing, MailingStatus
-from .services import send_mailing
-from clients.models import Recipient
+from .services import get_home_stats
+from .tasks import send_mailing_task
 
 
 class MailingListView(ListView):
@@ -20,17 +20,66 @@ class MailingListView(ListView):
     context_object_name = "mailings"
 
     def get_queryset(self):
-        qs = super().get_queryset()
+        qs = (
+            super().get_queryset()
+            .only("id", "status", "start_at", "end_at", "message", "created_at", "updated_at")
+            # флаг для строк считает БД, а не шаблон по объекту; без агрегатов — без GROUP BY
+            .annotate(
+                is_active=Case(
+                    When(status=MailingStatus.RUNNING, then=Value(True)),
+                    default=Value(False),
+                    output_field=BooleanField(),
+                ),
+            )
+        )
         status = self.request.GET.get("status")
         if status:
             qs = qs.filter(status=status)
-        return qs
+        return qs.order_by("-created_at")
+
+    def paginate_queryset(self, queryset, page_size):
+        # Число получателей — только для строк страницы, одним GROUP BY по through-таблице.
+        # Count() в основном запросе группировал бы всю таблицу до LIMIT и утяжелял COUNT пагинатора.
+        paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+        object_list = list(object_list)
+        counts = {}
+        if object_list:
+            counts = dict(
+                Mailing.recipients.through.objects
+                .filter(mailing_id__in=[m.pk for m in object_list])
+                .values("mailing_id")
+                .annotate(n=Count("id"))
+                .values_list("mailing_id", "n")
+            )
+        for m in object_list:
+            m.recipient_count = counts.get(m.pk, 0)
+        page.object_list = object_list
+        return paginator, page, object_list, is_paginated
 
 class MailingDetailView(DetailView):
     model = Mailing
     template_name = "mailings/mailing_detail.html"
     context_object_name = "mailing"
 
+    recent_limit = 20
+
+    def get_queryset(self):
+        # attempts/logs в шаблоне режутся до 20 строк — их не префетчим целиком
+        return super().get_queryset().select_related("message").prefetch_related("recipients")
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        # Журналы растут без ограничений: на странице только последние записи + общее число
+        ctx["recent_attempts"], ctx["attempts_count"] = self._recent(self.object.attempts.all())
+        ctx["recent_logs"], ctx["logs_count"] = self._recent(self.object.logs.all())
+        return ctx
+
+    def _recent(self, qs) -> tuple[list, int]:
+        rows = list(qs[: self.recent_limit])
+        # неполная страница — это и есть все записи, COUNT не нужен
+        count = len(rows) if len(rows) < self.recent_limit else qs.count()
+        return rows, count
+
 
 class MailingCreateView(CreateView):
     model = Mailing
@@ -38,11 +87,6 @@ class MailingCreateView(CreateView):
     template_name = "mailings/mailing_form.html"
     success_url = reverse_lazy("mailings:list")
 
-    def form_valid(self, form):
-        response = super().form_valid(form)
-        self.object.refresh_status(save=True)
-        return response
-
 
 class MailingUpdateView(UpdateView):
     model = Mailing
@@ -50,11 +94,6 @@ class MailingUpdateView(UpdateView):
     template_name = "mailings/mailing_form.html"
     success_url = reverse_lazy("mailings:list")
 
-    def form_valid(self, form):
-        response = super().form_valid(form)
-        self.object.refresh_status(save=True)
-        return response
-
 
 class MailingDeleteView(DeleteView):
     model = Mailing
@@ -63,22 +102,18 @@ class MailingDeleteView(DeleteView):
 
 
 class MailingSendView(View):
-    """Ручной запуск отправки рассылки из UI. POST-only."""
+    """Ручной запуск отправки рассылки из UI. POST-only.
+    Сама отправка идёт в Celery-воркере, запрос сразу возвращает редирект."""
     def post(self, request, pk: int):
-        mailing = get_object_or_404(Mailing, pk=pk)
+        # здесь нужна только проверка существования — сообщение и получателей читает задача
+        mailing = get_object_or_404(Mailing.objects.only("id"), pk=pk)
         dry_run = request.POST.get("dry_run") == "1"
-        result = send_mailing(mailing, user=request.user, dry_run=dry_run)
+        send_mailing_task.delay(mailing.pk, request.user.pk, dry_run)
 
         if dry_run:
-            messages.info(
-                request,
-                f"DRY-RUN: получателей={result.total}, бы отправили={result.total}, реально отправлено=0.",
-            )
+            messages.info(request, "DRY-RUN поставлен в очередь: результат появится в попытках рассылки.")
         else:
-            messages.success(
-                request,
-                f"Готово: всего={result.total}, отправлено={result.sent}, пропущено/ошибок={result.skipped}.",
-            )
+            messages.success(request, "Рассылка поставлена в очередь на отправку.")
         return redirect("mailings:detail", pk=mailing.pk)
 
 class HomeView(TemplateView):
@@ -87,15 +122,5 @@ class HomeView(TemplateView):
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
 
-        total_mailings = Mailing.objects.count()
-        active_mailings = Mailing.objects.filter(status=MailingStatus.RUNNING).count()
-
-        # Уникальные получатели, участвующие хотя бы в одной рассылке
-        unique_recipients = Recipient.objects.filter(mailings__isnull=False).distinct().count()
-
-        ctx.update(
-            total_mailings=total_mailings,
-            active_mailings=active_mailings,
-            unique_recipients=unique_recipients,
-        )
+        ctx.update(get_home_stats())
         return ctx
@@ -12,6 +12,10 @@ class MessageListView(ListView):
     context_object_name = "messages_list"
     paginate_by = 10
 
+    def get_queryset(self):
+        # В списке только тема и дата — большой body не тянем
+        return super().get_queryset().only("id", "subject", "created_at")
+
 
 class MessageDetailView(DetailView):
     model = Message